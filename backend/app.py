@@ -1,39 +1,59 @@
 # backend/app.py
+import time
+_IMPORT_STARTED = time.perf_counter()
+
 import os
 import uuid
 import json
-import qrcode
 from io import BytesIO
 from datetime import datetime
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Blueprint, current_app, request, jsonify, send_file
 from flask_cors import CORS
 from sqlalchemy import create_engine, Column, Integer, String, Text, ForeignKey
 from sqlalchemy.orm import sessionmaker, relationship, declarative_base
-from fpdf import FPDF
 
-from config import Config
-from chain_utils import sha256_file, sha256_bytes, merkle_root
-from crypto_utils import sign_hex, verify_hex, generate_keys_if_missing
+# Package-relative when imported as `backend.app` (main.py, Docker),
+# flat when run from inside backend/ (`python app.py`, gunicorn app:...)
+try:
+    from .config import Config
+    from .chain_utils import sha256_file, sha256_bytes, merkle_root
+    from .crypto_utils import generate_keys_if_missing
+except ImportError:
+    from config import Config
+    from chain_utils import sha256_file, sha256_bytes, merkle_root
+    from crypto_utils import generate_keys_if_missing
+
+_IMPORTS_DONE = time.perf_counter()
+
+# NOTE: qrcode, fpdf (and Pillow behind them) and pycryptodome are imported
+# inside the routes that need them, so a cold start doesn't pay for them.
 
 # -----------------------------
-# 1️⃣ Flask app setup
+# 1️⃣ Routes blueprint
 # -----------------------------
-app = Flask(__name__)
-CORS(app)
+api = Blueprint("api", __name__)
 
 # -----------------------------
 # 2️⃣ Database setup
 # -----------------------------
-DATABASE_URI = Config.get_database_uri()
-print(f"🗄️  Using database: {DATABASE_URI}")
-
-engine = create_engine(
-    DATABASE_URI,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URI else {}
-)
-SessionLocal = sessionmaker(bind=engine)
+# Each app created by create_app() keeps its own engine and session factory
+# in app.extensions["db"]; routes reach them through current_app.
 Base = declarative_base()
 
+def make_engine(database_uri=None):
+    """Create an engine for the given (or configured) database URI"""
+    database_uri = database_uri or Config.get_database_uri()
+    print(f"🗄️  Using database: {database_uri}")
+
+    return create_engine(
+        database_uri,
+        connect_args={"check_same_thread": False} if "sqlite" in database_uri else {}
+    )
+
+def get_session():
+    """Open a session on the current app's database"""
+    return current_app.extensions["db"]["session"]()
+
 # -----------------------------
 # 3️⃣ Models
 # -----------------------------
@@ -59,26 +79,63 @@ class Transaction(Base):
     title = Column(String(500))
     uploader = Column(String(256))
     description = Column(Text)
-    metadata = Column(Text)  # JSON string with file hashes
+    # "metadata" is reserved by declarative models, so map it under another name
+    file_metadata = Column("metadata", Text)  # JSON string with file hashes
     
     block = relationship("Block", back_populates="transactions")
 
 # -----------------------------
 # 4️⃣ Initialize database
 # -----------------------------
-def init_db():
+def init_db(engine=None):
     """Initialize database and generate keys"""
+    if engine is None:
+        engine = make_engine()
     print("🔧 Initializing database...")
+    Config.ensure_directories()
     Base.metadata.create_all(engine)
     generate_keys_if_missing()
     print("✅ Database initialized!")
 
 # -----------------------------
-# 5️⃣ Helper functions
+# 5️⃣ App factory
+# -----------------------------
+def create_app(database_uri=None):
+    """Create the Flask app, bind the database and initialize the schema"""
+    started = time.perf_counter()
+
+    app = Flask(__name__)
+    CORS(app)
+    app.register_blueprint(api)
+
+    engine = make_engine(database_uri)
+    init_db(engine)
+    # Don't hand schema-setup connections to forked gunicorn workers
+    # (an in-memory SQLite database lives only as long as its connection)
+    if engine.url.database not in (None, "", ":memory:"):
+        engine.dispose()
+    app.extensions["db"] = {
+        "engine": engine,
+        "session": sessionmaker(bind=engine),
+    }
+
+    now = time.perf_counter()
+    app.config["STARTUP_TIMES"] = {
+        "imports_ms": round((_IMPORTS_DONE - _IMPORT_STARTED) * 1000, 1),
+        "create_app_ms": round((now - started) * 1000, 1),
+    }
+    print(
+        f"⏱️  Startup: imports {app.config['STARTUP_TIMES']['imports_ms']} ms, "
+        f"create_app {app.config['STARTUP_TIMES']['create_app_ms']} ms"
+    )
+    return app
+
+# -----------------------------
+# 6️⃣ Helper functions
 # -----------------------------
 def get_latest_block():
     """Get the latest block in the chain"""
-    with SessionLocal() as session:
+    with get_session() as session:
         return session.query(Block).order_by(Block.idx.desc()).first()
 
 def create_block(transactions_data, previous_hash):
@@ -101,7 +158,7 @@ def create_block(transactions_data, previous_hash):
     block_hash = sha256_bytes(block_data.encode()).hex()
     
     # Save block
-    with SessionLocal() as session:
+    with get_session() as session:
         new_block = Block(
             idx=idx,
             timestamp=timestamp,
@@ -122,7 +179,7 @@ def create_block(transactions_data, previous_hash):
                 title=tx_data['title'],
                 uploader=tx_data['uploader'],
                 description=tx_data['description'],
-                metadata=tx_data['metadata']
+                file_metadata=tx_data['metadata']
             )
             session.add(new_tx)
         
@@ -135,13 +192,16 @@ def create_block(transactions_data, previous_hash):
         }
 
 # -----------------------------
-# 6️⃣ Routes
+# 7️⃣ Routes
 # -----------------------------
-@app.route("/", methods=["GET"])
+@api.route("/", methods=["GET"])
 def home():
-    return {"status": "BlockWitness Backend Running 🎉"}
+    return {
+        "status": "BlockWitness Backend Running 🎉",
+        "startup": current_app.config.get("STARTUP_TIMES", {})
+    }
 
-@app.route("/api/report", methods=["POST"])
+@api.route("/api/report", methods=["POST"])
 def create_report():
     """Create a new incident report with evidence files"""
     try:
@@ -208,10 +268,10 @@ def create_report():
         print(f"Error creating report: {e}")
         return jsonify({"error": str(e)}), 500
 
-@app.route("/api/explorer", methods=["GET"])
+@api.route("/api/explorer", methods=["GET"])
 def explorer():
     """Get all blocks in the blockchain"""
-    with SessionLocal() as session:
+    with get_session() as session:
         blocks = session.query(Block).order_by(Block.idx.asc()).all()
         result = []
         for block in blocks:
@@ -224,10 +284,10 @@ def explorer():
             })
         return jsonify(result)
 
-@app.route("/api/block/<int:idx>", methods=["GET"])
+@api.route("/api/block/<int:idx>", methods=["GET"])
 def get_block(idx):
     """Get detailed block information"""
-    with SessionLocal() as session:
+    with get_session() as session:
         block = session.query(Block).filter(Block.idx == idx).first()
         if not block:
             return jsonify({"error": "Block not found"}), 404
@@ -240,7 +300,7 @@ def get_block(idx):
                 "title": tx.title,
                 "uploader": tx.uploader,
                 "description": tx.description,
-                "metadata": json.loads(tx.metadata)
+                "metadata": json.loads(tx.file_metadata)
             })
         
         return jsonify({
@@ -252,7 +312,7 @@ def get_block(idx):
             "transactions": transactions
         })
 
-@app.route("/api/verify", methods=["POST"])
+@api.route("/api/verify", methods=["POST"])
 def verify_file():
     """Verify if a file exists in the blockchain"""
     try:
@@ -267,10 +327,10 @@ def verify_file():
         os.remove(temp_path)
         
         # Search for hash in database
-        with SessionLocal() as session:
+        with get_session() as session:
             transactions = session.query(Transaction).all()
             for tx in transactions:
-                metadata = json.loads(tx.metadata)
+                metadata = json.loads(tx.file_metadata)
                 for f in metadata['files']:
                     if f['hash'] == file_hash:
                         block = session.query(Block).filter(Block.id == tx.block_id).first()
@@ -293,14 +353,14 @@ def verify_file():
         print(f"Error verifying file: {e}")
         return jsonify({"error": str(e)}), 500
 
-@app.route("/api/search", methods=["GET"])
+@api.route("/api/search", methods=["GET"])
 def search():
     """Search reports by keyword"""
     query = request.args.get("q", "").lower()
     if not query:
         return jsonify([])
     
-    with SessionLocal() as session:
+    with get_session() as session:
         transactions = session.query(Transaction).all()
         results = []
         
@@ -324,10 +384,10 @@ def search():
         
         return jsonify(results)
 
-@app.route("/api/chain/timeline", methods=["GET"])
+@api.route("/api/chain/timeline", methods=["GET"])
 def timeline():
     """Get chronological timeline of all blocks"""
-    with SessionLocal() as session:
+    with get_session() as session:
         blocks = session.query(Block).order_by(Block.idx.asc()).all()
         result = []
         
@@ -350,10 +410,10 @@ def timeline():
         
         return jsonify(result)
 
-@app.route("/api/chain/verify", methods=["GET"])
+@api.route("/api/chain/verify", methods=["GET"])
 def verify_chain():
     """Verify the integrity of the entire blockchain"""
-    with SessionLocal() as session:
+    with get_session() as session:
         blocks = session.query(Block).order_by(Block.idx.asc()).all()
         
         problems = []
@@ -376,17 +436,20 @@ def verify_chain():
             "problems": problems
         })
 
-@app.route("/api/report/<report_id>/certificate", methods=["GET"])
+@api.route("/api/report/<report_id>/certificate", methods=["GET"])
 def download_certificate(report_id):
     """Generate and download PDF certificate for a report"""
     try:
-        with SessionLocal() as session:
+        with get_session() as session:
             tx = session.query(Transaction).filter(Transaction.report_id == report_id).first()
             if not tx:
                 return jsonify({"error": "Report not found"}), 404
             
             block = session.query(Block).filter(Block.id == tx.block_id).first()
             
+            import qrcode
+            from fpdf import FPDF
+
             # Generate PDF
             pdf = FPDF()
             pdf.add_page()
@@ -428,15 +491,17 @@ def download_certificate(report_id):
         print(f"Error generating certificate: {e}")
         return jsonify({"error": str(e)}), 500
 
-@app.route("/api/block/<int:idx>/qr", methods=["GET"])
+@api.route("/api/block/<int:idx>/qr", methods=["GET"])
 def get_block_qr(idx):
     """Generate QR code for block verification"""
     try:
-        with SessionLocal() as session:
+        with get_session() as session:
             block = session.query(Block).filter(Block.idx == idx).first()
             if not block:
                 return jsonify({"error": "Block not found"}), 404
             
+            import qrcode
+
             # Generate QR code
             qr = qrcode.QRCode(version=1, box_size=10, border=4)
             qr.add_data(f"Block: {block.idx}\nHash: {block.block_hash}\nMerkle: {block.merkle_root}")
@@ -458,12 +523,12 @@ def get_block_qr(idx):
         print(f"Error generating QR: {e}")
         return jsonify({"error": str(e)}), 500
 
-@app.route("/api/block/<int:idx>/merkle", methods=["GET"])
+@api.route("/api/block/<int:idx>/merkle", methods=["GET"])
 def get_merkle_proof(idx):
     """Generate Merkle proof for a file in a block"""
     leaf_hash = request.args.get("leaf", "")
     
-    with SessionLocal() as session:
+    with get_session() as session:
         block = session.query(Block).filter(Block.idx == idx).first()
         if not block:
             return jsonify({"error": "Block not found"}), 404
@@ -471,7 +536,7 @@ def get_merkle_proof(idx):
         # Get all file hashes from transactions
         all_hashes = []
         for tx in block.transactions:
-            metadata = json.loads(tx.metadata)
+            metadata = json.loads(tx.file_metadata)
             all_hashes.extend([f['hash'] for f in metadata['files']])
         
         if not all_hashes:
@@ -493,9 +558,11 @@ def get_merkle_proof(idx):
         })
 
 # -----------------------------
-# 7️⃣ Run the app
+# 8️⃣ Run the app
 # -----------------------------
+# Serve with `gunicorn --preload "app:create_app()"` so the schema and keys
+# are set up once, before the workers fork.
 if __name__ == "__main__":
-    init_db()
+    app = create_app()
     port = int(os.getenv("PORT", 8000))
-    app.run(host="0.0.0.0", port=port, debug=True)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=port, debug=True)
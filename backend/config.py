@@ -14,10 +14,12 @@ class Config:
     CERTIFICATES_FOLDER = os.path.join(os.path.dirname(__file__), "certificates")
     KEYS_FOLDER = os.path.join(os.path.dirname(__file__), "keys")
     
-    # Ensure directories exist
-    os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-    os.makedirs(CERTIFICATES_FOLDER, exist_ok=True)
-    os.makedirs(KEYS_FOLDER, exist_ok=True)
+    @classmethod
+    def ensure_directories(cls):
+        """Create upload, certificate and key directories if missing"""
+        os.makedirs(cls.UPLOAD_FOLDER, exist_ok=True)
+        os.makedirs(cls.CERTIFICATES_FOLDER, exist_ok=True)
+        os.makedirs(cls.KEYS_FOLDER, exist_ok=True)
     
     @classmethod
     def get_database_uri(cls):
@@ -1,7 +1,6 @@
 # backend/crypto_utils.py
-from Crypto.PublicKey import RSA
-from Crypto.Signature import pkcs1_15
-from Crypto.Hash import SHA256
+# pycryptodome is imported inside each function so importing this module
+# stays cheap at startup.
 import os
 
 def generate_keys_if_missing():
@@ -11,6 +10,8 @@ def generate_keys_if_missing():
     public_key_path = os.path.join(keys_folder, "issuer_pub.pem")
     
     if not os.path.exists(private_key_path) or not os.path.exists(public_key_path):
+        from Crypto.PublicKey import RSA
+
         print("🔑 Generating RSA keys...")
         key = RSA.generate(2048)
         
@@ -33,6 +34,10 @@ def sign_hex(private_key_path, data_hex):
     Returns:
         Hex signature string
     """
+    from Crypto.PublicKey import RSA
+    from Crypto.Signature import pkcs1_15
+    from Crypto.Hash import SHA256
+
     with open(private_key_path, 'rb') as f:
         key = RSA.import_key(f.read())
     
@@ -57,6 +62,10 @@ def verify_hex(public_key_path, data_hex, signature_hex):
     Returns:
         Boolean indicating if signature is valid
     """
+    from Crypto.PublicKey import RSA
+    from Crypto.Signature import pkcs1_15
+    from Crypto.Hash import SHA256
+
     try:
         with open(public_key_path, 'rb') as f:
             key = RSA.import_key(f.read())
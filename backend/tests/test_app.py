@@ -0,0 +1,42 @@
+# backend/tests/test_app.py
+import os
+import subprocess
+import sys
+
+from app import create_app
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+HEAVY_MODULES = ("qrcode", "fpdf", "PIL", "Crypto")
+
+
+def test_heavy_stacks_not_loaded_by_light_routes():
+    app = create_app("sqlite://")
+    client = app.test_client()
+
+    home = client.get("/")
+    assert home.status_code == 200
+    startup = home.get_json()["startup"]
+    assert set(startup) == {"imports_ms", "create_app_ms"}
+
+    assert client.get("/api/explorer").get_json() == []
+
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    assert loaded == []
+
+
+def test_apps_keep_their_own_database():
+    first = create_app("sqlite://")
+    second = create_app("sqlite://")
+
+    assert first.extensions["db"]["engine"] is not second.extensions["db"]["engine"]
+
+
+def test_backend_package_imports_from_repo_root():
+    # main.py and the Docker image import the app as `backend.app`
+    result = subprocess.run(
+        [sys.executable, "-c", "from backend.app import create_app; create_app('sqlite://')"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
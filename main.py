@@ -1,4 +1,6 @@
-from backend.app import app
+from backend.app import create_app
+
+app = create_app()
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8000, debug=True, use_reloader=False)
@@ -7,13 +7,7 @@ if [ -f .env ]; then
     export $(cat .env | grep -v '^#' | xargs)
 fi
 
-# Initialize database
-echo "🗄️  Initializing database..."
-cd backend
-python -c "from app import init_db; init_db()"
-cd ..
-
-# Start backend
+# Start backend (create_app() initializes the database)
 echo "🔧 Starting backend on port 8000..."
 cd backend
 python app.py &